@@ -1,11 +1,29 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+import threading
+import hashlib
 import time
 import json
+import os
+from operator import itemgetter
+
+try:
+    from indicators_nb import compute_all
+except ImportError:  # Numba is optional; fall back to the NumPy/pandas path
+    compute_all = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
 
 # Set page configuration
 st.set_page_config(
@@ -16,7 +34,7 @@ st.set_page_config(
 )
 
 # Custom CSS for styling
-st.markdown("""
+CSS_BLOCK = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -36,6 +54,29 @@ st.markdown("""
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         margin-bottom: 1rem;
     }
+    .metric-row {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 1rem;
+    }
+    .metric-row .metric-card {
+        flex: 1 1 10rem;
+    }
+    .metric-label {
+        font-size: 0.875rem;
+        color: #555;
+    }
+    .metric-value {
+        font-size: 1.75rem;
+        font-weight: 600;
+        color: #31333F;
+    }
+    .metric-delta.up {
+        color: #09ab3b;
+    }
+    .metric-delta.down {
+        color: #ff2b2b;
+    }
     .stock-info {
         background-color: #f9f9f9;
         padding: 1rem;
@@ -57,116 +98,586 @@ st.markdown("""
         border: 1px solid #30363d;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # Alpha Vantage API key (free tier)
 API_KEY = "demo"  # In production, use a real API key from Alpha Vantage
 
+REQUEST_TIMEOUT = (3, 7)  # (connect, read) seconds
+
+GITHUB_USERNAME = "praneeth11-busi"
+GITHUB_HEADERS = {"Accept": "application/vnd.github+json"}
+GITHUB_REPO_COUNT = 5  # Number of recent repositories shown
+
+# On-disk cache shared across Streamlit processes and restarts
+CACHE_DIR = ".cache"
+
+# Columns of the stock data DataFrame and the Alpha Vantage fields they come from
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+OHLCV_FIELDS = itemgetter("1. open", "2. high", "3. low", "4. close", "5. volume")
+
+# Technical indicator periods
+BB_WINDOW = 20
+RSI_PERIOD = 14
+INDICATOR_COLUMNS = ['SMA', 'RSI', 'BB_Middle', 'BB_Upper', 'BB_Lower']
+
+# Maximum points sent to the browser per indicator line
+MAX_LINE_POINTS = 2000
+
+# Default number of recent bars drawn in fast mode
+FAST_MODE_BARS = 300
+
+# Function to decode JSON bytes
+def loads_json(content):
+    """Decode JSON with orjson when installed, otherwise the standard library"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Persistent JSON cache for API responses
+class FileCache:
+    """Cache JSON payloads on disk under {root}/{endpoint}/{md5(key)}.json"""
+    
+    def __init__(self, root):
+        self.root = root
+    
+    def _path(self, endpoint, key):
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, endpoint, f"{digest}.json")
+    
+    def get_entry(self, endpoint, key):
+        """Return the raw entry dict (timestamp, value, etag), or None if missing"""
+        try:
+            with open(self._path(endpoint, key), "rb") as f:
+                return loads_json(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, endpoint, key, value, etag=None):
+        """Store value and its ETag, replacing any previous entry atomically"""
+        path = self._path(endpoint, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"timestamp": time.time(), "value": value, "etag": etag}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+FILE_CACHE = FileCache(CACHE_DIR)
+
+# Shared HTTP session, kept across reruns so API calls reuse pooled keep-alive connections
+@st.cache_resource
+def get_http_session():
+    """Return the process-wide requests.Session with pooling and retries for transient errors"""
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=False,  # Retry-After sleeps are uncapped
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+# Registry of in-flight requests, shared by all sessions of this process
+@st.cache_resource
+def _inflight_requests():
+    """Return the (lock, {key: Future}) pair used to coalesce identical requests"""
+    return threading.Lock(), {}
+
+# Function to coalesce concurrent identical requests
+def coalesce(key, func):
+    """Run func once for all concurrent callers with the same key and share its outcome"""
+    lock, inflight = _inflight_requests()
+    with lock:
+        future = inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = inflight[key] = Future()
+    if not is_leader:
+        return future.result()
+    
+    try:
+        result = func()
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    except BaseException:
+        # The leader was interrupted (e.g. a Streamlit rerun); fail the waiting
+        # callers with a regular error rather than leaving them blocked
+        future.set_exception(RuntimeError("Coalesced request was interrupted"))
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with lock:
+            del inflight[key]
+
+# Function to fetch JSON through the on-disk cache
+def fetch_json(endpoint, key, url, ttl, is_valid=bool, headers=None):
+    """Fetch JSON from url, using FILE_CACHE as a persistent second-level cache
+
+    A fresh cache entry is returned without a request. Otherwise concurrent
+    callers for the same entry share a single request (see coalesce).
+    """
+    entry = FILE_CACHE.get_entry(endpoint, key)
+    if entry is not None and time.time() - entry["timestamp"] <= ttl:
+        return entry["value"]
+    return coalesce(
+        (endpoint, key),
+        lambda: _refresh_json(endpoint, key, url, entry, is_valid, headers)
+    )
+
+def _refresh_json(endpoint, key, url, entry, is_valid, headers):
+    """Request url and write valid responses back to FILE_CACHE
+
+    Entries with an ETag are revalidated with If-None-Match, so a 304 reuses
+    the cached body. If the request fails or returns an invalid payload, the
+    stale entry is returned when available; otherwise the error propagates or
+    the invalid payload is returned for the caller to report.
+    """
+    stale = entry["value"] if entry is not None else None
+    request_headers = dict(headers or {})
+    if entry is not None and entry.get("etag"):
+        request_headers["If-None-Match"] = entry["etag"]
+    
+    try:
+        response = get_http_session().get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and entry is not None:
+            FILE_CACHE.set(endpoint, key, stale, entry.get("etag"))
+            return stale
+        response.raise_for_status()
+        data = loads_json(response.content)
+    except Exception:
+        if stale is None:
+            raise
+        return stale
+    
+    if is_valid(data):
+        FILE_CACHE.set(endpoint, key, data, response.headers.get("ETag"))
+        return data
+    return stale if stale is not None else data
+
+# Function to build the Alpha Vantage request for a symbol
+def _stock_data_request(symbol, interval):
+    """Return the file cache key, URL and time series field for a stock data request"""
+    if interval == "5min":
+        url = f"https://www.alphavantage.co/query?function=TIME_SERIES_INTRADAY&symbol={symbol}&interval=5min&apikey={API_KEY}"
+        series_key = "Time Series (5min)"
+    else:
+        url = f"https://www.alphavantage.co/query?function=TIME_SERIES_DAILY&symbol={symbol}&apikey={API_KEY}"
+        series_key = "Time Series (Daily)"
+    return f"get_stock_data:{symbol}:{interval}", url, series_key
+
+# Function to convert an Alpha Vantage time series to a DataFrame
+def _time_series_to_frame(time_series):
+    """Convert an Alpha Vantage time series payload to an OHLCV DataFrame"""
+    # NumPy parses the ISO 8601 keys ("YYYY-MM-DD[ HH:MM:SS]") in C
+    index = pd.DatetimeIndex(np.array(list(time_series), dtype="datetime64[s]"))
+    
+    # Build the float array in one pass instead of casting an object DataFrame
+    values = np.array(list(map(OHLCV_FIELDS, time_series.values())), dtype=np.float64)
+    df = pd.DataFrame(values, index=index, columns=OHLCV_COLUMNS)
+    
+    # Alpha Vantage lists the newest candle first; reversing avoids a sort
+    if df.index.is_monotonic_decreasing:
+        return df.iloc[::-1]
+    return df.sort_index()
+
+# Error raised when Alpha Vantage returns no time series
+class StockDataError(Exception):
+    """Alpha Vantage answered without a time series (rate limit, bad symbol, ...)"""
+
 # Function to get stock data
-@st.cache_data(ttl=60)  # Cache data for 60 seconds
+@st.cache_data(ttl=60, show_spinner=False)  # Cache data for 60 seconds
 def get_stock_data(symbol, interval="5min"):
-    """Fetch real-time stock data from Alpha Vantage API"""
+    """Fetch real-time stock data from Alpha Vantage API
+
+    Raises instead of calling st.error, since this runs on worker threads
+    (see fetch_dashboard_data); exceptions are not cached.
+    """
+    key, url, series_key = _stock_data_request(symbol, interval)
+    data = fetch_json(
+        "stock_data", key, url, ttl=60,
+        is_valid=lambda data: bool(data.get(series_key))
+    )
+    time_series = data.get(series_key, {})
+    
+    if not time_series:
+        raise StockDataError(f"Error fetching data for {symbol}: {data.get('Note', 'Unknown error')}")
+    
+    # Convert to DataFrame
+    return _time_series_to_frame(time_series)
+
+# Function to summarize the latest candle
+def data_signature(df):
+    """Return (timestamp, close) of the latest candle, used to detect new data"""
+    if df is None or df.empty:
+        return None
+    return (df.index[-1], float(df['Close'].iloc[-1]))
+
+# Function to poll for new stock data
+def poll_stock_signature(symbol, interval, max_age):
+    """Fetch the latest stock data, bypassing st.cache_data, and return its signature
+
+    File cache entries younger than max_age seconds are reused, so open tabs
+    share one poll and stay within the API rate limit.
+    """
+    key, url, series_key = _stock_data_request(symbol, interval)
     try:
-        if interval == "5min":
-            url = f"https://www.alphavantage.co/query?function=TIME_SERIES_INTRADAY&symbol={symbol}&interval=5min&apikey={API_KEY}"
-        else:
-            url = f"https://www.alphavantage.co/query?function=TIME_SERIES_DAILY&symbol={symbol}&apikey={API_KEY}"
-        
-        response = requests.get(url)
-        data = response.json()
-        
-        if interval == "5min":
-            time_series = data.get("Time Series (5min)", {})
-        else:
-            time_series = data.get("Time Series (Daily)", {})
-        
-        if not time_series:
-            st.error(f"Error fetching data for {symbol}: {data.get('Note', 'Unknown error')}")
-            return None
-        
-        # Convert to DataFrame
-        df = pd.DataFrame.from_dict(time_series, orient="index")
-        df.columns = [col.split(" ")[1].capitalize() for col in df.columns]
-        df.index = pd.to_datetime(df.index)
-        df = df.astype(float)
-        df = df.sort_index()
-        
-        return df
-    except Exception as e:
-        st.error(f"Error fetching data: {e}")
+        data = fetch_json(
+            "stock_data", key, url, ttl=max_age,
+            is_valid=lambda data: bool(data.get(series_key))
+        )
+    except Exception:
+        return None
+    time_series = data.get(series_key)
+    if not time_series:
         return None
+    return data_signature(_time_series_to_frame(time_series))
 
 # Function to get stock overview
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
 def get_stock_overview(symbol):
     """Fetch company overview data"""
-    try:
-        url = f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={symbol}&apikey={API_KEY}"
-        response = requests.get(url)
-        data = response.json()
-        return data
-    except Exception as e:
-        st.error(f"Error fetching overview: {e}")
-        return None
+    url = f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={symbol}&apikey={API_KEY}"
+    return fetch_json(
+        "stock_overview", f"get_stock_overview:{symbol}", url, ttl=3600,
+        is_valid=lambda data: "Symbol" in data
+    )
 
 # Function to get GitHub profile data
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
 def get_github_profile(username):
     """Fetch GitHub profile data"""
-    try:
-        url = f"https://api.github.com/users/{username}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Error fetching GitHub profile: {response.status_code}")
-            return None
-    except Exception as e:
-        st.error(f"Error fetching GitHub data: {e}")
-        return None
+    url = f"https://api.github.com/users/{username}"
+    return fetch_json(
+        "github_profile", f"get_github_profile:{username}", url, ttl=3600,
+        headers=GITHUB_HEADERS
+    )
 
 # Function to get GitHub repositories
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
 def get_github_repos(username):
     """Fetch GitHub repositories"""
+    url = f"https://api.github.com/users/{username}/repos?sort=updated&per_page={GITHUB_REPO_COUNT}"
+    return fetch_json(
+        "github_repos", f"get_github_repos:{username}", url, ttl=3600,
+        headers=GITHUB_HEADERS
+    )
+
+# Functions to describe fetch errors
+def _stock_data_error(e):
+    return str(e) if isinstance(e, StockDataError) else f"Error fetching data: {e}"
+
+def _overview_error(e):
+    return f"Error fetching overview: {e}"
+
+def _github_profile_error(e):
+    if isinstance(e, requests.HTTPError):
+        return f"Error fetching GitHub profile: {e.response.status_code}"
+    return f"Error fetching GitHub data: {e}"
+
+def _github_repos_error(e):
+    if isinstance(e, requests.HTTPError):
+        return f"Error fetching GitHub repos: {e.response.status_code}"
+    return f"Error fetching GitHub repos: {e}"
+
+# Function to collect a fetch result on the script thread
+def _result_or_error(future, describe_error):
+    """Return the future's result, or show describe_error(exc) and return None"""
     try:
-        url = f"https://api.github.com/users/{username}/repos?sort=updated"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Error fetching GitHub repos: {response.status_code}")
-            return None
+        return future.result()
     except Exception as e:
-        st.error(f"Error fetching GitHub repos: {e}")
+        st.error(describe_error(e))
         return None
 
+# Function to fetch all dashboard data concurrently
+def fetch_dashboard_data(symbol, interval, username):
+    """Fetch stock data, overview and GitHub data in parallel
+
+    Workers only do the (cached) network I/O and never write Streamlit
+    elements; errors are shown here on the script thread in a fixed order.
+    """
+    with st.spinner("Loading market and GitHub data..."):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            stock_future = executor.submit(get_stock_data, symbol, interval)
+            overview_future = executor.submit(get_stock_overview, symbol)
+            profile_future = executor.submit(get_github_profile, username)
+            repos_future = executor.submit(get_github_repos, username)
+    return (
+        _result_or_error(stock_future, _stock_data_error),
+        _result_or_error(overview_future, _overview_error),
+        _result_or_error(profile_future, _github_profile_error),
+        _result_or_error(repos_future, _github_repos_error),
+    )
+
 # Function to calculate technical indicators
-def calculate_technical_indicators(df, window=20):
-    """Calculate SMA, RSI, and other technical indicators"""
+def calculate_technical_indicators(df, window=20, cache_key=None):
+    """Calculate SMA, RSI, and other technical indicators
+
+    When cache_key is given, the previous result is kept in st.session_state
+    and only the rows appended since the last call are computed.
+    """
+    if cache_key is None:
+        return _compute_technical_indicators(df, window)[0]
+    
+    cached = st.session_state.get(cache_key)
+    update = _update_technical_indicators(df, window, cached) if cached else None
+    if update is None:
+        update = _compute_technical_indicators(df, window)
+    result, avg_gain, avg_loss = update
+    st.session_state[cache_key] = _indicator_state(result, window, avg_gain, avg_loss)
+    return result
+
+def _rolling_mean_std(values, window):
+    """Rolling mean and sample std from cumulative sums, NaN-padded like Series.rolling"""
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n < window:
+        return mean, std
+    
+    # Centering keeps the sum of squares well conditioned for large prices
+    shift = values.mean()
+    centered = values - shift
+    cs = np.concatenate(([0.0], centered.cumsum()))
+    cs2 = np.concatenate(([0.0], (centered ** 2).cumsum()))
+    window_sum = cs[window:] - cs[:-window]
+    window_sumsq = cs2[window:] - cs2[:-window]
+    mean[window - 1:] = window_sum / window + shift
+    if window > 1:
+        var = (window_sumsq - window_sum ** 2 / window) / (window - 1)
+        std[window - 1:] = np.sqrt(np.maximum(var, 0))
+    return mean, std
+
+def _compute_technical_indicators(df, window):
+    """Compute all indicators over the full DataFrame
+
+    Returns the DataFrame with indicator columns and the final Wilder
+    average gain and loss, which seed incremental RSI updates.
+    """
     df = df.copy()
+    if len(df) < min(window, BB_WINDOW, RSI_PERIOD):
+        # Too short for any indicator window: every value would be NaN
+        for col in INDICATOR_COLUMNS:
+            df[col] = np.nan
+        return df, np.nan, np.nan
+    
+    close = df['Close'].to_numpy()
+    
+    if compute_all is not None:
+        sma, bb_mean, bb_upper, bb_lower, rsi, avg_gain, avg_loss = compute_all(
+            close, window, BB_WINDOW, RSI_PERIOD
+        )
+        df['SMA'] = sma
+        df['RSI'] = rsi
+        df['BB_Middle'] = bb_mean
+        df['BB_Upper'] = bb_upper
+        df['BB_Lower'] = bb_lower
+        return df, avg_gain, avg_loss
     
     # Simple Moving Average
-    df['SMA'] = df['Close'].rolling(window=window).mean()
+    df['SMA'] = _rolling_mean_std(close, window)[0]
     
-    # RSI (Relative Strength Index)
+    # RSI (Relative Strength Index) with Wilder's smoothing (RMA)
     delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    avg_gain = gain.ewm(alpha=1 / RSI_PERIOD, adjust=False).mean()
+    avg_loss = loss.ewm(alpha=1 / RSI_PERIOD, adjust=False).mean()
+    rs = avg_gain / avg_loss
+    rsi = 100 - (100 / (1 + rs))
+    rsi.iloc[:RSI_PERIOD - 1] = np.nan
+    df['RSI'] = rsi
     
     # Bollinger Bands
-    df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-    bb_std = df['Close'].rolling(window=20).std()
-    df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
-    df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
+    bb_mean, bb_std = _rolling_mean_std(close, BB_WINDOW)
+    df['BB_Middle'] = bb_mean
+    df['BB_Upper'] = bb_mean + (bb_std * 2)
+    df['BB_Lower'] = bb_mean - (bb_std * 2)
+    
+    return df, avg_gain.iloc[-1], avg_loss.iloc[-1]
+
+def _indicator_state(df, window, avg_gain, avg_loss):
+    """Build the running window sums and RSI averages needed to extend df by new rows"""
+    if len(df) <= max(window, BB_WINDOW, RSI_PERIOD):
+        return None
+    
+    close = df['Close'].to_numpy()
+    sma_sum = close[-window:].sum()
+    bb_sum = close[-BB_WINDOW:].sum()
+    bb_sumsq = (close[-BB_WINDOW:] ** 2).sum()
+    return (df, sma_sum, bb_sum, bb_sumsq, avg_gain, avg_loss)
+
+def _update_technical_indicators(df, window, cached):
+    """Extend a cached indicator result with the rows appended to df
+
+    Returns (df, avg_gain, avg_loss) like _compute_technical_indicators, or
+    None when the cached result cannot be reused, e.g. when a previously
+    seen candle was revised or the history no longer overlaps.
+    """
+    prev_df, sma_sum, bb_sum, bb_sumsq, avg_gain, avg_loss = cached
+    last = prev_df.index[-1]
+    if last not in df.index:
+        return None
     
-    return df
+    pos = df.index.get_loc(last)
+    if pos < max(window, BB_WINDOW, RSI_PERIOD):
+        return None
+    
+    prev = prev_df.reindex(df.index[:pos + 1])
+    if not prev[df.columns].equals(df.iloc[:pos + 1]):
+        return None
+    if pos == len(df) - 1:
+        return prev_df.loc[df.index[0]:], avg_gain, avg_loss
+    
+    close = df['Close'].to_numpy()
+    
+    n_new = len(df) - pos - 1
+    sma = np.empty(n_new)
+    bb_mean = np.empty(n_new)
+    bb_var = np.empty(n_new)
+    rsi_gain = np.empty(n_new)
+    rsi_loss = np.empty(n_new)
+    for i, t in enumerate(range(pos + 1, len(df))):
+        sma_sum += close[t] - close[t - window]
+        bb_sum += close[t] - close[t - BB_WINDOW]
+        bb_sumsq += close[t] ** 2 - close[t - BB_WINDOW] ** 2
+        delta = close[t] - close[t - 1]
+        avg_gain = (avg_gain * (RSI_PERIOD - 1) + max(delta, 0)) / RSI_PERIOD
+        avg_loss = (avg_loss * (RSI_PERIOD - 1) + max(-delta, 0)) / RSI_PERIOD
+        sma[i] = sma_sum / window
+        bb_mean[i] = bb_sum / BB_WINDOW
+        bb_var[i] = (bb_sumsq - bb_sum ** 2 / BB_WINDOW) / (BB_WINDOW - 1)
+        rsi_gain[i] = avg_gain
+        rsi_loss[i] = avg_loss
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + rsi_gain / rsi_loss))
+    bb_std = np.sqrt(np.maximum(bb_var, 0))
+    
+    new_rows = df.iloc[pos + 1:].copy()
+    new_rows['SMA'] = sma
+    new_rows['RSI'] = rsi
+    new_rows['BB_Middle'] = bb_mean
+    new_rows['BB_Upper'] = bb_mean + (bb_std * 2)
+    new_rows['BB_Lower'] = bb_mean - (bb_std * 2)
+    
+    result = pd.concat([prev[df.columns.tolist() + INDICATOR_COLUMNS], new_rows])
+    return result, avg_gain, avg_loss
+
+# Function to downsample a line with Largest-Triangle-Three-Buckets
+def lttb_indices(x, y, threshold):
+    """Return the indices of the points kept by LTTB downsampling to threshold points"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    bucket_size = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        
+        # Pick the point forming the largest triangle with the previous
+        # selected point and the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+# Function to prepare an indicator line for plotting
+def downsample_line(series, max_points=MAX_LINE_POINTS):
+    """Drop NaNs and LTTB-downsample a time-indexed Series, returning float32 (x, y) arrays"""
+    series = series.dropna()
+    x = series.index
+    y = series.to_numpy(np.float32)
+    if len(y) > max_points:
+        idx = lttb_indices(x.asi8.astype(np.float64), y, max_points)
+        x, y = x[idx], y[idx]
+    return x.to_numpy(), y
+
+# Function to build WebGL price segments
+def webgl_price_segments(x, open_, high, low, close):
+    """Return (x, y) line segments for up wicks, up bodies, down wicks and down bodies
+
+    Each bar becomes (x, y0), (x, y1), (x, NaN); the NaN breaks the line
+    between bars so each color is drawn as one batched trace.
+    """
+    def segments(mask, y0, y1):
+        xs = np.repeat(x[mask], 3)
+        ys = np.stack([y0[mask], y1[mask], np.full(mask.sum(), np.nan, dtype=y0.dtype)], axis=1).ravel()
+        return xs, ys
+    
+    up = close > open_
+    return [
+        segments(up, low, high),
+        segments(up, open_, close),
+        segments(~up, low, high),
+        segments(~up, open_, close),
+    ]
+
+# Function to build WebGL price traces
+def webgl_price_traces(x, open_, high, low, close):
+    """Draw OHLC bars as batched Scattergl line segments, one wick and one body trace per color"""
+    segments = webgl_price_segments(x, open_, high, low, close)
+    styles = [('green', 'Up', 1), ('green', 'Up', 5), ('red', 'Down', 1), ('red', 'Down', 5)]
+    traces = []
+    for (seg_x, seg_y), (color, name, width) in zip(segments, styles):
+        is_wick = width == 1
+        traces.append(go.Scattergl(
+            x=seg_x, y=seg_y, mode='lines',
+            line=dict(color=color, width=width),
+            name=name, legendgroup=name, showlegend=not is_wick,
+            hoverinfo='skip' if is_wick else None
+        ))
+    return traces
+
+# Function to prepare chart data
+def chart_data(df):
+    """Extract the arrays plotted by create_stock_chart
+
+    Plain float32 arrays serialize to half-size typed arrays and skip
+    per-element Series iteration in plotly. Indicator lines are downsampled;
+    the price and volume bars stay at full resolution.
+    """
+    open_ = df['Open'].to_numpy(np.float32)
+    close = df['Close'].to_numpy(np.float32)
+    return {
+        'x': df.index.to_numpy(),
+        'open': open_,
+        'high': df['High'].to_numpy(np.float32),
+        'low': df['Low'].to_numpy(np.float32),
+        'close': close,
+        'volume': df['Volume'].to_numpy(np.float32),
+        'colors': np.where(open_ >= close, 'red', 'green').tolist(),
+        'sma': downsample_line(df['SMA']),
+        'bb_upper': downsample_line(df['BB_Upper']),
+        'bb_lower': downsample_line(df['BB_Lower']),
+        'rsi': downsample_line(df['RSI']),
+    }
 
 # Function to create stock chart
-def create_stock_chart(df, symbol):
+def create_stock_chart(df, symbol, fast_mode=False):
     """Create an interactive stock chart with technical indicators"""
+    data = chart_data(df)
+    x = data['x']
+    
     # Create subplots
     fig = make_subplots(
         rows=3, cols=1,
@@ -177,52 +688,55 @@ def create_stock_chart(df, symbol):
     )
     
     # Price data
-    fig.add_trace(go.Candlestick(
-        x=df.index,
-        open=df['Open'],
-        high=df['High'],
-        low=df['Low'],
-        close=df['Close'],
-        name='Price'
-    ), row=1, col=1)
+    if fast_mode:
+        for trace in webgl_price_traces(x, data['open'], data['high'], data['low'], data['close']):
+            fig.add_trace(trace, row=1, col=1)
+    else:
+        fig.add_trace(go.Candlestick(
+            x=x,
+            open=data['open'],
+            high=data['high'],
+            low=data['low'],
+            close=data['close'],
+            name='Price'
+        ), row=1, col=1)
     
     # SMA
     fig.add_trace(go.Scatter(
-        x=df.index,
-        y=df['SMA'],
+        x=data['sma'][0],
+        y=data['sma'][1],
         line=dict(color='orange', width=1),
         name='SMA (20)'
     ), row=1, col=1)
     
     # Bollinger Bands
     fig.add_trace(go.Scatter(
-        x=df.index,
-        y=df['BB_Upper'],
+        x=data['bb_upper'][0],
+        y=data['bb_upper'][1],
         line=dict(color='gray', width=1, dash='dash'),
         name='BB Upper'
     ), row=1, col=1)
     
     fig.add_trace(go.Scatter(
-        x=df.index,
-        y=df['BB_Lower'],
+        x=data['bb_lower'][0],
+        y=data['bb_lower'][1],
         line=dict(color='gray', width=1, dash='dash'),
         name='BB Lower',
         fill='tonexty'
     ), row=1, col=1)
     
     # Volume
-    colors = ['red' if row['Open'] - row['Close'] >= 0 else 'green' for _, row in df.iterrows()]
     fig.add_trace(go.Bar(
-        x=df.index,
-        y=df['Volume'],
+        x=x,
+        y=data['volume'],
         name='Volume',
-        marker_color=colors
+        marker_color=data['colors']
     ), row=2, col=1)
     
     # RSI
     fig.add_trace(go.Scatter(
-        x=df.index,
-        y=df['RSI'],
+        x=data['rsi'][0],
+        y=data['rsi'][1],
         line=dict(color='purple', width=2),
         name='RSI'
     ), row=3, col=1)
@@ -245,8 +759,75 @@ def create_stock_chart(df, symbol):
     
     return fig
 
+# Function to update an existing stock chart
+def update_stock_chart(fig, df, fast_mode=False):
+    """Replace the data of a chart built by create_stock_chart in place"""
+    data = chart_data(df)
+    x = data['x']
+    with fig.batch_update():
+        if fast_mode:
+            segments = webgl_price_segments(x, data['open'], data['high'], data['low'], data['close'])
+            for trace, (seg_x, seg_y) in zip(fig.data[:4], segments):
+                trace.update(x=seg_x, y=seg_y)
+            first = 4
+        else:
+            fig.data[0].update(
+                x=x, open=data['open'], high=data['high'],
+                low=data['low'], close=data['close']
+            )
+            first = 1
+        sma, bb_upper, bb_lower, volume, rsi = fig.data[first:first + 5]
+        sma.update(x=data['sma'][0], y=data['sma'][1])
+        bb_upper.update(x=data['bb_upper'][0], y=data['bb_upper'][1])
+        bb_lower.update(x=data['bb_lower'][0], y=data['bb_lower'][1])
+        volume.update(x=x, y=data['volume'], marker_color=data['colors'])
+        rsi.update(x=data['rsi'][0], y=data['rsi'][1])
+
+# Function to get the stock chart for this session
+def get_stock_chart(df, symbol, interval, fast_mode=False):
+    """Return this session's chart, updating its traces in place instead of rebuilding
+
+    The figure is rebuilt only when the symbol, interval or fast mode changes,
+    and left untouched while chart_signature(df) is unchanged.
+    """
+    layout_key = (symbol, interval, fast_mode)
+    sig = chart_signature(df)
+    cached = st.session_state.get('chart')
+    if cached is None or cached[0] != layout_key:
+        fig = create_stock_chart(df, symbol, fast_mode)
+    else:
+        _, cached_sig, fig = cached
+        if cached_sig != sig:
+            update_stock_chart(fig, df, fast_mode)
+    st.session_state['chart'] = (layout_key, sig, fig)
+    return fig
+
+# Function to render the key metric cards
+def metric_cards_html(metrics):
+    """Render (label, value, delta percent or None) metrics as one row of HTML cards"""
+    cards = []
+    for label, value, delta in metrics:
+        delta_html = ""
+        if delta is not None:
+            direction, arrow = ("down", "▼") if delta < 0 else ("up", "▲")
+            delta_html = f'<div class="metric-delta {direction}">{arrow} {delta:.2f}%</div>'
+        cards.append(
+            f'<div class="metric-card"><div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{value}</div>{delta_html}</div>'
+        )
+    return f'<div class="metric-row">{"".join(cards)}</div>'
+
+# Function to identify the data behind a chart
+def chart_signature(df):
+    """Return (last timestamp, row count, last close) identifying the charted data"""
+    return (df.index[-1], len(df), float(df['Close'].iloc[-1]))
+
 # Main app
 def main():
+    # Styles are re-emitted every run: Streamlit drops elements a rerun does not
+    # write again, and unchanged elements are not re-rendered by the frontend
+    st.markdown(CSS_BLOCK, unsafe_allow_html=True)
+    
     # Header
     st.markdown('<h1 class="main-header">📈 Real-Time Stock Market Dashboard</h1>', unsafe_allow_html=True)
     
@@ -283,54 +864,48 @@ def main():
     auto_refresh = st.sidebar.checkbox("Auto Refresh", value=True)
     refresh_interval = st.sidebar.slider("Refresh Interval (seconds)", 10, 300, 60)
     
-    # Get stock data
+    # Rendering control
+    fast_mode = st.sidebar.checkbox(
+        "Fast Mode", value=False,
+        help="Draw prices with WebGL and only plot the most recent bars"
+    )
+    if fast_mode:
+        max_bars = st.sidebar.slider("Bars to display", 50, 1000, FAST_MODE_BARS)
+    
+    # Get stock and GitHub data
     interval = "5min" if time_frame == "Intraday (5min)" else "daily"
-    df = get_stock_data(selected_stock, interval)
+    df, overview, github_profile, github_repos = fetch_dashboard_data(
+        selected_stock, interval, GITHUB_USERNAME
+    )
+    st.session_state['last_sig'] = data_signature(df)
     
     if df is not None and not df.empty:
         # Calculate technical indicators
-        df = calculate_technical_indicators(df)
+        df = calculate_technical_indicators(df, cache_key=f"ind_{selected_stock}_{interval}")
         
         # Get the latest data point
         latest = df.iloc[-1]
         
-        # Display key metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Current Price", f"${latest['Close']:.2f}")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            change = latest['Close'] - df.iloc[-2]['Close']
-            change_percent = (change / df.iloc[-2]['Close']) * 100
-            st.metric("Change", f"${change:.2f}", f"{change_percent:.2f}%")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Volume", f"{latest['Volume']:,.0f}")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("RSI", f"{latest['RSI']:.2f}")
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Display key metrics as a single HTML row
+        change = latest['Close'] - df.iloc[-2]['Close']
+        change_percent = (change / df.iloc[-2]['Close']) * 100
+        st.markdown(metric_cards_html([
+            ("Current Price", f"&#36;{latest['Close']:.2f}", None),
+            ("Change", f"&#36;{change:.2f}", change_percent),
+            ("Volume", f"{latest['Volume']:,.0f}", None),
+            ("RSI", f"{latest['RSI']:.2f}", None),
+        ]), unsafe_allow_html=True)
         
         # Display stock chart
         st.markdown('<div class="subheader">Price Chart with Technical Indicators</div>', unsafe_allow_html=True)
-        fig = create_stock_chart(df, selected_stock)
+        chart_df = df.iloc[-max_bars:] if fast_mode else df
+        fig = get_stock_chart(chart_df, selected_stock, interval, fast_mode)
         st.plotly_chart(fig, use_container_width=True)
         
         # Display additional stock information
         st.markdown('<div class="subheader">Stock Information</div>', unsafe_allow_html=True)
         
-        # Get company overview
-        overview = get_stock_overview(selected_stock)
-        
-        if overview and not overview.get("Note"):
+        if overview and "Symbol" in overview:
             col1, col2, col3 = st.columns(3)
             
             with col1:
@@ -372,11 +947,7 @@ def main():
     # GitHub Section
     st.markdown("---")
     st.markdown('<div class="github-section">', unsafe_allow_html=True)
-    st.markdown('<h2 class="subheader" style="color: white;">👨‍💻 GitHub Profile: praneeth11-busi</h2>', unsafe_allow_html=True)
-    
-    # Get GitHub data
-    github_profile = get_github_profile("praneeth11-busi")
-    github_repos = get_github_repos("praneeth11-busi")
+    st.markdown(f'<h2 class="subheader" style="color: white;">👨‍💻 GitHub Profile: {GITHUB_USERNAME}</h2>', unsafe_allow_html=True)
     
     if github_profile:
         col1, col2, col3, col4 = st.columns(4)
@@ -395,7 +966,7 @@ def main():
     
     if github_repos:
         st.markdown("### Latest Repositories")
-        for repo in github_repos[:5]:  # Show only 5 most recent repos
+        for repo in github_repos[:GITHUB_REPO_COUNT]:  # Show only the most recent repos
             with st.container():
                 st.markdown('<div class="repo-card">', unsafe_allow_html=True)
                 st.markdown(f"#### [{repo['name']}]({repo['html_url']})")
@@ -406,10 +977,16 @@ def main():
     
     st.markdown('</div>', unsafe_allow_html=True)
     
-    # Auto-refresh logic
+    # Auto-refresh logic: only rerun the script once the latest candle changes
     if auto_refresh:
-        time.sleep(refresh_interval)
-        st.rerun()
+        status = st.empty()
+        while True:
+            time.sleep(refresh_interval)
+            status.caption(f"Last checked for new data at {datetime.now():%H:%M:%S}")
+            sig = poll_stock_signature(selected_stock, interval, min(refresh_interval, 60))
+            if sig is not None and sig != st.session_state.get('last_sig'):
+                get_stock_data.clear(selected_stock, interval)
+                st.rerun()
 
 if __name__ == "__main__":
     main()
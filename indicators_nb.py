@@ -0,0 +1,64 @@
+import numpy as np
+from numba import njit
+
+# Single-pass technical indicator kernel compiled with Numba
+@njit(cache=True)
+def compute_all(close, window=20, bb_window=20, rsi_period=14):
+    """Compute SMA, Bollinger Bands and Wilder RSI over close in one pass
+
+    Returns (sma, bb_middle, bb_upper, bb_lower, rsi, avg_gain, avg_loss)
+    where the arrays are NaN during each indicator's warm-up period and
+    avg_gain/avg_loss are the final Wilder averages used to extend the RSI.
+    Matches the pandas rolling (sample std) and ewm(adjust=False) results.
+    """
+    n = close.shape[0]
+    sma = np.full(n, np.nan)
+    bb_middle = np.full(n, np.nan)
+    bb_upper = np.full(n, np.nan)
+    bb_lower = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    if n == 0:
+        return sma, bb_middle, bb_upper, bb_lower, rsi, np.nan, np.nan
+
+    # Sums are taken relative to the first close to keep the variance well conditioned
+    shift = close[0]
+    sma_sum = 0.0
+    bb_sum = 0.0
+    bb_sumsq = 0.0
+    alpha = 1.0 / rsi_period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for t in range(n):
+        x = close[t] - shift
+        sma_sum += x
+        bb_sum += x
+        bb_sumsq += x * x
+        if t >= window:
+            sma_sum -= close[t - window] - shift
+        if t >= bb_window:
+            old = close[t - bb_window] - shift
+            bb_sum -= old
+            bb_sumsq -= old * old
+
+        if t >= window - 1:
+            sma[t] = sma_sum / window + shift
+        if t >= bb_window - 1:
+            mean = bb_sum / bb_window
+            bb_middle[t] = mean + shift
+            if bb_window > 1:
+                var = (bb_sumsq - bb_sum * bb_sum / bb_window) / (bb_window - 1)
+                std = np.sqrt(max(var, 0.0))
+                bb_upper[t] = bb_middle[t] + 2 * std
+                bb_lower[t] = bb_middle[t] - 2 * std
+
+        if t > 0:
+            delta = close[t] - close[t - 1]
+            avg_gain = (1 - alpha) * avg_gain + alpha * max(delta, 0.0)
+            avg_loss = (1 - alpha) * avg_loss + alpha * max(-delta, 0.0)
+        if t >= rsi_period - 1:
+            if avg_loss > 0:
+                rsi[t] = 100 - 100 / (1 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                rsi[t] = 100.0
+
+    return sma, bb_middle, bb_upper, bb_lower, rsi, avg_gain, avg_loss